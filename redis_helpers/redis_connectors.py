@@ -6,76 +6,411 @@
 """
 
 # Python Library Imports
+import asyncio
+import functools
 import logging
 import redis
-import wrapt
+import redis.asyncio as aioredis
+import socket
+import threading
+import weakref
 
 
-def get_redis_connector(host, port=6379, password=None, db=0):
+###
+# Connection Pools
+###
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+# asyncio connections belong to the event loop that opened them, so async
+# pools are cached per loop (and dropped with it)
+_ASYNC_POOLS = weakref.WeakKeyDictionary()
+_ASYNC_POOLS_LOCK = threading.Lock()
+
+# Keep idle pooled sockets alive through middleboxes (only the options the
+# platform supports; TCP_KEEPIDLE and friends are not available everywhere)
+_SOCKET_KEEPALIVE_OPTIONS = {
+    getattr(socket, option): value
+    for option, value in [
+        ("TCP_KEEPIDLE", 60),
+        ("TCP_KEEPINTVL", 30),
+        ("TCP_KEEPCNT", 3),
+    ]
+    if hasattr(socket, option)
+}
+# Default connection options for every pool (overridable per pool)
+_POOL_SOCKET_OPTIONS = {
+    "socket_keepalive": True,
+    "socket_keepalive_options": _SOCKET_KEEPALIVE_OPTIONS,
+    "socket_connect_timeout": 2,
+    "socket_timeout": 5,
+    "health_check_interval": 30,
+}
+
+
+def get_redis_connector(
+    host, port=6379, password=None, db=0, decode_responses=False, **pool_options
+):
     """
         Purpose:
-            Decorator for connecting to redis database
+            Decorator for connecting to redis database. The redis_con is
+            injected as the first argument, so only plain functions and
+            staticmethods are supported (on methods it would be passed in
+            place of self)
         Args:
             host (string): host of server
             password (string): password for redis
             port (int): port number for redis-server instance
             db (int): db instance in redis to connect to
+            decode_responses (bool): whether redis-py should decode replies
+                to str while parsing them
+            pool_options (Dict): overrides for the pool's connection
+                options (see _POOL_SOCKET_OPTIONS), e.g. socket_timeout=None
+                for blocking commands or long running calls
         Returns:
             decorator (function): function decorating another
                 function and injecting a redis_con for connection,
                 committing, and closing the db connection
     """
 
-    @wrapt.decorator
-    def with_connection(f, instance, args, kwargs):
+    pool = get_redis_connection_pool(
+        host,
+        port=port,
+        password=password,
+        db=db,
+        decode_responses=decode_responses,
+        **pool_options,
+    )
+    # Everything is resolved up front so each call only checks out a connection
+    _make_conn = functools.partial(redis.StrictRedis, connection_pool=pool)
+
+    def with_connection(f):
         """
             Purpose:
                 Database connection wrapping function
             Args:
-                f (function/method): function being decorated
-                instance: pass in self when wraping class method.
-                    default is None when wraping function.
-                args (Tuple): List of arguments
-                kwargs (Dict): Dictionary of named arguments
+                f (function): function being decorated
             Return:
-                output (Object): Output of the wrapped Function
-            Function Termination:
-                Will close connection to the Redis database
+                wrapper (function): function injecting a redis_con as
+                    the first argument of f
         """
 
-        redis_con = get_redis_connection(host, port=port, password=password, db=db)
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            """
+                Purpose:
+                    Call the wrapped function with a pooled connection
+                Args:
+                    args (Tuple): List of arguments
+                    kwargs (Dict): Dictionary of named arguments
+                Return:
+                    output (Object): Output of the wrapped Function
+                Function Termination:
+                    Will close connection to the Redis database
+            """
 
-        output = f(redis_con, *args, **kwargs)
-        return output
+            redis_con = _make_conn()
+
+            try:
+                return f(redis_con, *args, **kwargs)
+            finally:
+                # Release the connection back to the pool (the pool stays open)
+                try:
+                    redis_con.close()
+                except Exception:
+                    pass
+
+        return wrapper
 
     return with_connection
 
 
-def get_redis_connection(host, port=6379, password=None, db=0):
+def get_redis_connection(
+    host, port=6379, password=None, db=0, decode_responses=False, **pool_options
+):
     """
         Purpose:
-            Get Redis Connection.
+            Get Redis Connection. Connections are checked out of a
+            pool shared by every caller using the same server/db
         Args:
             host (string): host of server
             password (string): password for redis
             port (int): port number for redis-server instance
             db (int): db instance in redis to connect to
+            decode_responses (bool): whether redis-py should decode replies
+                to str while parsing them
+            pool_options (Dict): overrides for the pool's connection
+                options (see _POOL_SOCKET_OPTIONS), e.g. socket_timeout=None
+                for blocking commands or long running calls
         Returns:
             redis_con (StrictRedis): Redis Connection Object
     """
-    logging.info(f"Connecting to Redis (db {db}) on {host}:{port}")
+    logging.info("Connecting to Redis (db %s) on %s:%s", db, host, port)
 
     try:
-        if password:
-            redis_con = redis.StrictRedis(
-                host=host, port=port, db=db, password=password
-            )
-        else:
-            redis_con = redis.StrictRedis(host=host, port=port, db=db)
-        # Need to actually utilize connect to make sure it is connected
-        redis_con.keys()
+        pool = get_redis_connection_pool(
+            host,
+            port=port,
+            password=password,
+            db=db,
+            decode_responses=decode_responses,
+            **pool_options,
+        )
+        redis_con = redis.StrictRedis(connection_pool=pool)
+        # Need to actually utilize connect to make sure it is connected. PING
+        # is O(1) where KEYS would walk (and block) the whole keyspace
+        redis_con.ping()
     except Exception as err:
-        logging.exception(f"Error connecting to Redis: {err}")
+        logging.exception("Error connecting to Redis: %s", err)
         raise
 
     return redis_con
+
+
+def get_redis_connection_pool(
+    host, port=6379, password=None, db=0, decode_responses=False, **pool_options
+):
+    """
+        Purpose:
+            Get Redis Connection Pool. Pools are created once per
+            (host, port, db, password, decode_responses, pool_options) and
+            reused for later calls. By default pooled sockets use TCP
+            keepalive, connect/read timeouts and a periodic health check
+        Args:
+            host (string): host of server
+            password (string): password for redis
+            port (int): port number for redis-server instance
+            db (int): db instance in redis to connect to
+            decode_responses (bool): whether redis-py should decode replies
+                to str while parsing them
+            pool_options (Dict): overrides for the pool's connection
+                options (see _POOL_SOCKET_OPTIONS), e.g. socket_timeout=None
+                for blocking commands or long running calls
+        Returns:
+            pool (ConnectionPool): Redis Connection Pool Object
+    """
+
+    pool_options = {**_POOL_SOCKET_OPTIONS, **pool_options}
+    pool_key = (
+        host,
+        port,
+        db,
+        password,
+        decode_responses,
+        _get_pool_options_key(pool_options),
+    )
+    with _POOLS_LOCK:
+        if pool_key not in _POOLS:
+            _POOLS[pool_key] = redis.ConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                password=password,
+                decode_responses=decode_responses,
+                **pool_options,
+            )
+
+        return _POOLS[pool_key]
+
+
+def _get_pool_options_key(pool_options):
+    """
+        Purpose:
+            Build a hashable form of the pool options for the pool caches
+        Args:
+            pool_options (Dict): connection options of the pool
+        Returns:
+            pool_options_key (Tuple): hashable form of the options
+    """
+
+    return tuple(
+        sorted(
+            (name, _get_pool_option_key(value)) for name, value in pool_options.items()
+        )
+    )
+
+
+def _get_pool_option_key(value):
+    """
+        Purpose:
+            Build a hashable form of a single pool option (e.g. the
+            socket_keepalive_options dict or a retry_on_error list)
+        Args:
+            value (Object): value of the pool option
+        Returns:
+            value_key (Object): hashable form of the value
+    """
+
+    if isinstance(value, dict):
+        value = tuple(sorted(value.items()))
+    elif isinstance(value, list):
+        value = tuple(value)
+    elif isinstance(value, set):
+        value = frozenset(value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+
+    return value
+
+
+###
+# Async Connections
+###
+
+
+def get_async_redis_connector(
+    host, port=6379, password=None, db=0, decode_responses=False, **pool_options
+):
+    """
+        Purpose:
+            Decorator for connecting to redis database from a coroutine
+            function. Lets callers run many independent Redis operations
+            concurrently (e.g. with asyncio.gather) on one thread. Pooled
+            connections stay open between calls, so callers must await
+            close_async_redis_connection_pools() before their event loop
+            is closed (e.g. at the end of the coroutine given to asyncio.run)
+        Args:
+            host (string): host of server
+            password (string): password for redis
+            port (int): port number for redis-server instance
+            db (int): db instance in redis to connect to
+            decode_responses (bool): whether redis-py should decode replies
+                to str while parsing them
+            pool_options (Dict): overrides for the pool's connection
+                options (see _POOL_SOCKET_OPTIONS), e.g. socket_timeout=None
+                for blocking commands or long running calls
+        Returns:
+            decorator (function): function decorating a coroutine
+                function and injecting an asyncio redis_con for
+                connection and closing the db connection
+    """
+
+    # The pool can only be resolved inside the running event loop, so bind
+    # the arguments now and look the pool up per call
+    _get_pool = functools.partial(
+        get_async_redis_connection_pool,
+        host,
+        port=port,
+        password=password,
+        db=db,
+        decode_responses=decode_responses,
+        **pool_options,
+    )
+
+    def with_connection(f):
+        """
+            Purpose:
+                Database connection wrapping function
+            Args:
+                f (coroutine function): function being decorated
+            Return:
+                wrapper (coroutine function): function injecting a
+                    redis_con as the first argument of f
+        """
+
+        @functools.wraps(f)
+        async def wrapper(*args, **kwargs):
+            """
+                Purpose:
+                    Await the wrapped function with a pooled connection
+                Args:
+                    args (Tuple): List of arguments
+                    kwargs (Dict): Dictionary of named arguments
+                Return:
+                    output (Object): Output of the wrapped Function
+                Function Termination:
+                    Will close connection to the Redis database
+            """
+
+            redis_con = aioredis.Redis(connection_pool=_get_pool())
+
+            try:
+                return await f(redis_con, *args, **kwargs)
+            finally:
+                # Release the connection back to the pool (the pool stays open).
+                # aclose replaced close in newer redis-py releases
+                try:
+                    close = getattr(redis_con, "aclose", None) or redis_con.close
+                    await close()
+                except Exception:
+                    pass
+
+        return wrapper
+
+    return with_connection
+
+
+def get_async_redis_connection_pool(
+    host, port=6379, password=None, db=0, decode_responses=False, **pool_options
+):
+    """
+        Purpose:
+            Get asyncio Redis Connection Pool for the running event loop.
+            Pools are created once per event loop and (host, port, db,
+            password, decode_responses, pool_options) and reused for later
+            calls in that loop, separately from the synchronous pools.
+            Must be called from a coroutine, and the loop's pools must be
+            closed with close_async_redis_connection_pools() before the
+            loop is closed
+        Args:
+            host (string): host of server
+            password (string): password for redis
+            port (int): port number for redis-server instance
+            db (int): db instance in redis to connect to
+            decode_responses (bool): whether redis-py should decode replies
+                to str while parsing them
+            pool_options (Dict): overrides for the pool's connection
+                options (see _POOL_SOCKET_OPTIONS), e.g. socket_timeout=None
+                for blocking commands or long running calls
+        Returns:
+            pool (redis.asyncio.ConnectionPool): asyncio Redis Connection
+                Pool Object
+    """
+
+    pool_options = {**_POOL_SOCKET_OPTIONS, **pool_options}
+    pool_key = (
+        host,
+        port,
+        db,
+        password,
+        decode_responses,
+        _get_pool_options_key(pool_options),
+    )
+    loop = asyncio.get_running_loop()
+    with _ASYNC_POOLS_LOCK:
+        loop_pools = _ASYNC_POOLS.setdefault(loop, {})
+        if pool_key not in loop_pools:
+            loop_pools[pool_key] = aioredis.ConnectionPool(
+                host=host,
+                port=port,
+                db=db,
+                password=password,
+                decode_responses=decode_responses,
+                **pool_options,
+            )
+
+        return loop_pools[pool_key]
+
+
+async def close_async_redis_connection_pools():
+    """
+        Purpose:
+            Disconnect and forget the asyncio Redis Connection Pools of the
+            running event loop. Must be awaited before the loop is closed,
+            otherwise the pooled sockets are leaked with the loop
+        Args:
+            N/A
+        Returns:
+            N/A
+    """
+
+    loop = asyncio.get_running_loop()
+    with _ASYNC_POOLS_LOCK:
+        loop_pools = _ASYNC_POOLS.pop(loop, {})
+
+    for pool in loop_pools.values():
+        await pool.disconnect()
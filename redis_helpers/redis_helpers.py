@@ -7,9 +7,31 @@
 """
 
 # Python Library Imports
+import functools
 import logging
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+###
+# Lua Scripts
+###
+
+
+# GET the key, SET it only when absent and return the prior value (nil when
+# the key was set)
+_SET_IF_ABSENT_LUA = """
+local prior = redis.call('GET', KEYS[1])
+if not prior then
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return prior
+"""
+
 
 ###
 # DB Management
@@ -35,7 +57,7 @@ def run_flushdb(redis_con):
     try:
         redis_con.flushdb()
     except Exception as err:
-        logging.error("Error Flushing DB: {0}".format(err))
+        logging.error("Error Flushing DB: %s", err)
         return False
 
     return True
@@ -46,54 +68,84 @@ def run_flushdb(redis_con):
 ###
 
 
-def get_keys_matching_pattern(redis_con, pattern="*"):
+def get_keys_matching_pattern(redis_con, pattern="*", count=1000):
     """
         Purpose:
             Get keys matching specified pattern. Default is all
+            keys in the redis instance. Keys are fetched lazily with SCAN
+            as the returned iterator is consumed, so Redis is never blocked
+            walking the whole keyspace and callers can start on the first
+            keys before the rest arrive
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            pattern (Regex/String): Regex or String for deleting
+                keys in Redis Database
+            count (int): hint for the number of keys Redis returns
+                per SCAN call
+        Return
+            keys (Iterator of Strings): keys matching specified pattern
+    """
+    logging.info("Getting Keys from Redis Database: %s", pattern)
+
+    return redis_con.scan_iter(match=pattern, count=count)
+
+
+def get_all_keys_matching_pattern(redis_con, pattern="*", count=1000):
+    """
+        Purpose:
+            Get keys matching specified pattern as a list. Default is all
             keys in the redis instance
         Args:
             redis_con (Redis StrictRedis): Connection
                 to Redis database
             pattern (Regex/String): Regex or String for deleting
                 keys in Redis Database
+            count (int): hint for the number of keys Redis returns
+                per SCAN call
         Return
             keys (List of Strings): list of keys matching specified pattern
     """
-    logging.info("Getting Keys from Redis Database: {pattern}".format(pattern=pattern))
 
-    return list(redis_con.keys(pattern))
+    return list(get_keys_matching_pattern(redis_con, pattern=pattern, count=count))
 
 
-def delete_keys_matching_pattern(redis_con, pattern):
+def delete_keys_matching_pattern(redis_con, pattern, batch_size=500):
     """
         Purpose:
-            Run Delete all keys matching a specified pattern
+            Run Delete all keys matching a specified pattern. Keys are
+            UNLINKed (freed asynchronously by Redis) in batches so neither
+            the client nor the server has to hold every key at once
         Args:
             redis_con (Redis StrictRedis): Connection
                 to Redis database
             pattern (Regex/String): Regex or String for deleting
                 keys in Redis Database
+            batch_size (int): number of keys to UNLINK per command
         Return
             was_successful (bool): whether or not the
                 command was successful running
     """
-    logging.info("Delete Keys Matching Pattern: {0}".format(pattern))
-
-    keys = get_keys_matching_pattern(redis_con, pattern=pattern)
-    pipe = redis_con.pipeline()
-    for key in keys:
-        pipe.delete(key)
+    logging.info("Delete Keys Matching Pattern: %s", pattern)
 
+    # No atomicity is needed across keys, so skip the MULTI/EXEC wrapper
+    pipe = redis_con.pipeline(transaction=False)
+    batch = []
     try:
-        values = pipe.execute()
+        for key in get_keys_matching_pattern(redis_con, pattern=pattern):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                pipe.unlink(*batch)
+                pipe.execute()
+                batch = []
+        if batch:
+            pipe.unlink(*batch)
+            pipe.execute()
     except Exception as err:
-        logging.error("Exception Deleting Keys: {0}".format(err))
+        logging.error("Exception Deleting Keys: %s", err)
         return False
 
-    if False in values:
-        return False
-    else:
-        return True
+    return True
 
 
 ###
@@ -117,35 +169,22 @@ def set_value_of_single_value_key(
             key (Object): key to set in Redis
             value (Object): value to set in Redis for the specified key
             value_format (string): form of value to convert to string.
-                Currently supports json via json.loads. But can be expanded
+                Currently supports json via orjson/json. But can be expanded
             value_encode (string): encoding type for the value
         Return
             was_successful (bool): whether or not the
                 command was successful running
     """
-    logging.info(
-        "Setting Key {0}: {1} (overwrite set to {2})".format(key, value, overwrite)
-    )
-
-    existing_value = redis_con.get(key)
-    if existing_value and not overwrite:
-        logging.info(
-            "Not Setting Value. Key already exists and overwrite set" " to False"
-        )
-        return False
-
-    if value_format == "json":
-        value = json.dumps(value)
-    if value_encode:
-        value = value.encode("utf-8")
+    value = _serialize(value, value_format=value_format, value_encode=value_encode)
 
     try:
-        redis_con.set(key, value)
+        # SET NX checks for an existing key server-side in the same round trip
+        was_set = redis_con.set(key, value, nx=not overwrite)
     except Exception as err:
-        logging.error("Error Setting Key {0}: {1}".format(key, value))
+        logging.error("Error Setting Key %s: %s", key, err)
         return False
 
-    return True
+    return _check_set_result(key, value, overwrite, was_set)
 
 
 def get_value_of_single_value_key(redis_con, key, value_format=None, value_decode=None):
@@ -158,21 +197,115 @@ def get_value_of_single_value_key(redis_con, key, value_format=None, value_decod
                 to Redis database
             key (string): key to get data from Redis
             value_format (string): form to return value. Currently
-                supports json via json.loads. But can be expanded
+                supports json via orjson/json. But can be expanded
             value_decode (string): encoding type for the value
         Return
             value (Object): value stored in the passed
                 in key as an object
     """
-    logging.info("Getting Data from Redis Database for key: {key}".format(key=key))
+    logging.info("Getting Data from Redis Database for key: %s", key)
 
     value = redis_con.get(key)
-    if value_decode:
-        value = value.decode("utf-8")
-    if value_format == "json":
-        value = json.loads(value)
+    return _deserialize(value, value_format=value_format, value_decode=value_decode)
+
+
+def get_or_set_value_of_single_value_key(
+    redis_con,
+    key,
+    value,
+    value_format=None,
+    value_encode=None,
+    value_decode=None,
+):
+    """
+        Purpose:
+            Set data for key holding single value only if the key does not
+            exist, returning the value it already held. The check and the
+            write run atomically in one round trip as a Lua script
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            key (Object): key to set in Redis
+            value (Object): value to set in Redis for the specified key
+            value_format (string): form of value to convert to string (and
+                of the prior value returned). Currently supports json via
+                orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+            value_decode (string): encoding type for the prior value
+        Return
+            prior_value (Object): value the key already held, or None if
+                the key did not exist and the value was set
+    """
+    logging.info("Setting Key %s if absent: %s", key, value)
+
+    value = _serialize(value, value_format=value_format, value_encode=value_encode)
+    # Registering only hashes the script locally; it is sent with EVALSHA and
+    # loaded on the server the first time it is missing there
+    set_if_absent_script = redis_con.register_script(_SET_IF_ABSENT_LUA)
+    prior_value = set_if_absent_script(keys=[key], args=[value])
+
+    return _deserialize(
+        prior_value, value_format=value_format, value_decode=value_decode
+    )
+
+
+def mset_values(redis_con, mapping, value_format=None, value_encode=None):
+    """
+        Purpose:
+            Set data for many keys holding single values (stored as strings)
+            in one MSET command (one round trip). Existing keys are
+            overwritten
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            mapping (Dict): keys and values to set in Redis
+            value_format (string): form of value to convert to string.
+                Currently supports json via orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+        Return
+            was_successful (bool): whether or not the
+                command was successful running
+    """
+    logging.info("Setting %s Keys", len(mapping))
+
+    mapping = {
+        key: _serialize(value, value_format=value_format, value_encode=value_encode)
+        for key, value in mapping.items()
+    }
 
-    return value
+    try:
+        redis_con.mset(mapping)
+    except Exception as err:
+        logging.error("Error Setting Keys: %s", err)
+        return False
+
+    return True
+
+
+def mget_values(redis_con, keys, value_format=None, value_decode=None):
+    """
+        Purpose:
+            Get data from many single-value keys in one MGET command (one
+            round trip). Values will be decoded if necessary
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            keys (List of strings): keys to get data from Redis
+            value_format (string): form to return value. Currently
+                supports json via orjson/json. But can be expanded
+            value_decode (string): encoding type for the value
+        Return
+            values (List of Objects): values stored in the passed in keys,
+                in the same order (None for keys that do not exist)
+    """
+    logging.info("Getting Data from Redis Database for %s keys", len(keys))
+
+    values = redis_con.mget(keys)
+    deserialize = _make_value_deserializer(value_format, value_decode)
+    if deserialize is None:
+        return values
+
+    return [deserialize(value) for value in values]
 
 
 ###
@@ -193,17 +326,552 @@ def add_value_to_list_key(redis_con, key, value, value_format=None, value_encode
             was_successful (bool): whether or not the
                 command was successful running
     """
-    logging.info("Appending Value to Key {0}: {1}".format(key, value))
+    logging.info("Appending Value to Key %s: %s", key, value)
 
-    if value_format == "json":
-        value = json.dumps(value)
-    if value_encode:
-        value = value.encode("utf-8")
+    value = _serialize(value, value_format=value_format, value_encode=value_encode)
 
     try:
         redis_con.lpush(key, value)
     except Exception as err:
-        logging.error("Error Setting Key {0}: {1}".format(key, value))
+        logging.error("Error Setting Key %s: %s", key, err)
+        return False
+
+    return True
+
+
+def lpush_values(redis_con, key, values, value_format=None, value_encode=None):
+    """
+        Purpose:
+            add many values to key holding list in one LPUSH command
+            (one round trip regardless of the number of values)
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            key (Object): key to set in Redis
+            values (List of Objects): values to add to the list
+            value_format (string): form of value to convert to string.
+                Currently supports json via orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+        Return
+            was_successful (bool): whether or not the
+                command was successful running
+    """
+    logging.info("Appending %s Values to Key %s", len(values), key)
+
+    values = [
+        _serialize(value, value_format=value_format, value_encode=value_encode)
+        for value in values
+    ]
+
+    try:
+        redis_con.lpush(key, *values)
+    except Exception as err:
+        logging.error("Error Setting Key %s: %s", key, err)
+        return False
+
+    return True
+
+
+def lpush_many(redis_con, key, values):
+    """
+        Purpose:
+            add many raw values to key holding list in one LPUSH command.
+            See lpush_values for json/encoding support
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            key (Object): key to set in Redis
+            values (List of Objects): values to add to the list
+        Return
+            was_successful (bool): whether or not the
+                command was successful running
+    """
+
+    return lpush_values(redis_con, key, values)
+
+
+def iter_list_values(redis_con, key, chunk=1000, value_format=None, value_decode=None):
+    """
+        Purpose:
+            Iterate over the values of key holding list, fetching them with
+            LRANGE in chunks so the whole list is never held in memory
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            key (string): key to get data from Redis
+            chunk (int): number of values to fetch per LRANGE call (at
+                least 1)
+            value_format (string): form to return value. Currently
+                supports json via orjson/json. But can be expanded
+            value_decode (string): encoding type for the value
+        Return
+            values (Iterator of Objects): values stored in the list, in
+                list order
+    """
+    if chunk < 1:
+        raise ValueError(f"chunk must be at least 1, got {chunk}")
+
+    logging.info("Getting List Values from Redis Database for key: %s", key)
+
+    return _iter_list_values(redis_con, key, chunk, value_format, value_decode)
+
+
+def _iter_list_values(redis_con, key, chunk, value_format, value_decode):
+    """
+        Purpose:
+            Generator behind iter_list_values (kept separate so arguments
+            are validated when iter_list_values is called, not on first
+            iteration)
+        Args:
+            redis_con (Redis StrictRedis): Connection
+                to Redis database
+            key (string): key to get data from Redis
+            chunk (int): number of values to fetch per LRANGE call
+            value_format (string): form to return value
+            value_decode (string): encoding type for the value
+        Yield
+            value (Object): value stored in the list, in list order
+    """
+
+    start = 0
+    while True:
+        values = redis_con.lrange(key, start, start + chunk - 1)
+        for value in values:
+            yield _deserialize(
+                value, value_format=value_format, value_decode=value_decode
+            )
+
+        if len(values) < chunk:
+            break
+        start += chunk
+
+
+###
+# Async Single Value Key (String Keys) Functions
+###
+
+
+async def aset_value_of_single_value_key(
+    redis_con, key, value, overwrite=False, value_format=None, value_encode=None
+):
+    """
+        Purpose:
+            asyncio version of set_value_of_single_value_key. Set data for
+            key holding single value (stored as strings).
+
+            If overwrite is false, do not overwrite already existing key.
+            If it is true, set value regardless of if the key exists in
+            the db
+        Args:
+            redis_con (redis.asyncio Redis): Connection
+                to Redis database
+            key (Object): key to set in Redis
+            value (Object): value to set in Redis for the specified key
+            value_format (string): form of value to convert to string.
+                Currently supports json via orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+        Return
+            was_successful (bool): whether or not the
+                command was successful running
+    """
+    value = _serialize(value, value_format=value_format, value_encode=value_encode)
+
+    try:
+        # SET NX checks for an existing key server-side in the same round trip
+        was_set = await redis_con.set(key, value, nx=not overwrite)
+    except Exception as err:
+        logging.error("Error Setting Key %s: %s", key, err)
+        return False
+
+    return _check_set_result(key, value, overwrite, was_set)
+
+
+async def aget_value_of_single_value_key(
+    redis_con, key, value_format=None, value_decode=None
+):
+    """
+        Purpose:
+            asyncio version of get_value_of_single_value_key. Get data from
+            corresponding single-value key passed in (stored as strings and
+            will be decoded if necessary).
+        Args:
+            redis_con (redis.asyncio Redis): Connection
+                to Redis database
+            key (string): key to get data from Redis
+            value_format (string): form to return value. Currently
+                supports json via orjson/json. But can be expanded
+            value_decode (string): encoding type for the value
+        Return
+            value (Object): value stored in the passed
+                in key as an object
+    """
+    logging.info("Getting Data from Redis Database for key: %s", key)
+
+    value = await redis_con.get(key)
+    return _deserialize(value, value_format=value_format, value_decode=value_decode)
+
+
+###
+# Specialized Value Functions
+###
+
+
+def make_value_setter(value_format=None, value_encode=None):
+    """
+        Purpose:
+            Build a setter for single-value keys with the value_format and
+            value_encode choice resolved once up front, for hot loops that
+            write many values the same way. The setter always overwrites
+            and does no logging or error handling
+        Args:
+            value_format (string): form of value to convert to string.
+                Currently supports json via orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+        Return
+            setter (function): setter(redis_con, key, value) issuing a
+                single SET and returning its result
+    """
+    serialize = _make_value_serializer(value_format, value_encode)
+
+    if serialize is None:
+
+        def _set_raw(redis_con, key, value):
+            return redis_con.set(key, value)
+
+        return _set_raw
+
+    def _set_serialized(redis_con, key, value):
+        return redis_con.set(key, serialize(value))
+
+    return _set_serialized
+
+
+def make_value_getter(value_format=None, value_decode=None):
+    """
+        Purpose:
+            Build a getter for single-value keys with the value_format and
+            value_decode choice resolved once up front. The getter does no
+            logging
+        Args:
+            value_format (string): form to return value. Currently
+                supports json via orjson/json. But can be expanded
+            value_decode (string): encoding type for the value
+        Return
+            getter (function): getter(redis_con, key) issuing a single GET
+                and returning the converted value
+    """
+    deserialize = _make_value_deserializer(value_format, value_decode)
+
+    if deserialize is None:
+
+        def _get_raw(redis_con, key):
+            return redis_con.get(key)
+
+        return _get_raw
+
+    def _get_deserialized(redis_con, key):
+        return deserialize(redis_con.get(key))
+
+    return _get_deserialized
+
+
+def make_list_value_adder(value_format=None, value_encode=None):
+    """
+        Purpose:
+            Build a function adding values to keys holding lists with the
+            value_format and value_encode choice resolved once up front.
+            The adder does no logging or error handling
+        Args:
+            value_format (string): form of value to convert to string.
+                Currently supports json via orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+        Return
+            adder (function): adder(redis_con, key, value) issuing a single
+                LPUSH and returning its result
+    """
+    serialize = _make_value_serializer(value_format, value_encode)
+
+    if serialize is None:
+
+        def _add_raw(redis_con, key, value):
+            return redis_con.lpush(key, value)
+
+        return _add_raw
+
+    def _add_serialized(redis_con, key, value):
+        return redis_con.lpush(key, serialize(value))
+
+    return _add_serialized
+
+
+###
+# Serialization Functions
+###
+
+
+# Longer strings are serialized directly so the cache never pins large values
+_SERIALIZE_CACHE_MAX_LENGTH = 256
+
+
+def _serialize(value, value_format=None, value_encode=None):
+    """
+        Purpose:
+            Convert a value into the form stored in Redis. Integers and
+            short strings are memoized so repeated writes of the same value
+            skip the json/encode work; floats are not, as equal floats can
+            serialize differently (0.0 and -0.0). Bytes are assumed to be
+            serialized already
+        Args:
+            value (Object): value to serialize
+            value_format (string): form of value to convert to string.
+                Currently supports json via orjson/json. But can be expanded
+            value_encode (string): encoding type for the value
+        Return
+            value (Object): serialized value
+    """
+
+    if isinstance(value, bytes) or (value_format is None and not value_encode):
+        return value
+    if isinstance(value, int) or (
+        isinstance(value, str) and len(value) <= _SERIALIZE_CACHE_MAX_LENGTH
+    ):
+        return _serialize_cached(value, value_format, value_encode)
+
+    return _serialize_value(value, value_format, value_encode)
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _serialize_cached(value, value_format, value_encode):
+    """
+        Purpose:
+            Memoized _serialize_value for integers and short strings (typed
+            so that 1 and True are cached separately)
+        Args:
+            value (Object): value to serialize
+            value_format (string): form of value to convert to string
+            value_encode (string): encoding type for the value
+        Return
+            value (Object): serialized value
+    """
+
+    return _serialize_value(value, value_format, value_encode)
+
+
+def _serialize_value(value, value_format, value_encode):
+    """
+        Purpose:
+            Apply the json/encode transforms to a value (with the same
+            serializer the make_value_setter family uses)
+        Args:
+            value (Object): value to serialize
+            value_format (string): form of value to convert to string
+            value_encode (string): encoding type for the value
+        Return
+            value (Object): serialized value
+    """
+
+    serialize = _make_value_serializer(value_format, value_encode)
+    if serialize is None:
+        return value
+
+    return serialize(value)
+
+
+def _deserialize(value, value_format=None, value_decode=None):
+    """
+        Purpose:
+            Convert a value read from Redis into the form requested (with
+            the same deserializer the make_value_getter family uses)
+        Args:
+            value (Object): value read from Redis
+            value_format (string): form to return value. Currently
+                supports json via orjson/json. But can be expanded
+            value_decode (string): encoding type for the value
+        Return
+            value (Object): deserialized value
+    """
+
+    deserialize = _make_value_deserializer(value_format, value_decode)
+    if deserialize is None:
+        return value
+
+    return deserialize(value)
+
+
+def _check_set_result(key, value, overwrite, was_set):
+    """
+        Purpose:
+            Log the outcome of a (SET NX when not overwriting) write and
+            turn it into was_successful
+        Args:
+            key (Object): key set in Redis
+            value (Object): serialized value set in Redis
+            overwrite (bool): whether the write could overwrite the key
+            was_set (bool): reply of the SET command
+        Return
+            was_successful (bool): whether or not the
+                value was set
+    """
+    logging.info("Setting Key %s: %s (overwrite set to %s)", key, value, overwrite)
+
+    if not was_set:
+        logging.info(
+            "Not Setting Value. Key already exists and overwrite set" " to False"
+        )
         return False
 
     return True
+
+
+def _json_dumps(value):
+    """
+        Purpose:
+            Dump a value to json. Uses orjson when it is installed (which
+            returns utf-8 bytes directly) and falls back to the standard
+            library (compact separators) otherwise, or for values orjson
+            rejects (e.g. integers over 64 bits).
+
+            Note: orjson writes NaN/Infinity as null. Where that matters,
+            store such values without value_format="json"
+        Args:
+            value (Object): value to dump
+        Return
+            value (String/Bytes): json form of the value
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _json_loads(value):
+    """
+        Purpose:
+            Load a json value (str or bytes). Uses orjson when it is
+            installed and falls back to the standard library otherwise, or
+            for json orjson rejects (e.g. NaN/Infinity written without
+            orjson).
+
+            Note: orjson loads integers over 64 bits as floats, so they do
+            not round trip exactly when orjson is installed
+        Args:
+            value (String/Bytes): json to load
+        Return
+            value (Object): loaded value
+    """
+
+    if value is None:
+        return None
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(value)
+
+
+def _make_value_serializer(value_format, value_encode):
+    """
+        Purpose:
+            Pick the serialization function for a value_format/value_encode
+            combination so callers do not re-check the options per value
+        Args:
+            value_format (string): form of value to convert to string
+            value_encode (string): encoding type for the value
+        Return
+            serialize (function): function serializing one value, or None
+                if values are stored as they are
+    """
+
+    if value_format == "json" and value_encode:
+        return _dump_json_encoded
+    if value_format == "json":
+        return _dump_json
+    if value_encode:
+        return _encode
+
+    return None
+
+
+def _make_value_deserializer(value_format, value_decode):
+    """
+        Purpose:
+            Pick the deserialization function for a value_format/value_decode
+            combination so callers do not re-check the options per value
+        Args:
+            value_format (string): form to return value
+            value_decode (string): encoding type for the value
+        Return
+            deserialize (function): function deserializing one value, or
+                None if values are returned as they are
+    """
+
+    if value_format == "json":
+        # json parsers take bytes directly, so no separate decode is needed
+        return _json_loads
+    if value_decode:
+        return _decode
+
+    return None
+
+
+def _dump_json(value):
+    """
+        Purpose:
+            Dump a value to json (bytes are assumed to be serialized
+            already and are returned as is)
+        Args:
+            value (Object): value to dump
+        Return
+            value (String/Bytes): json form of the value
+    """
+
+    return value if isinstance(value, bytes) else _json_dumps(value)
+
+
+def _dump_json_encoded(value):
+    """
+        Purpose:
+            Dump a value to utf-8 encoded json (bytes are assumed to be
+            serialized already and are returned as is)
+        Args:
+            value (Object): value to dump
+        Return
+            value (Bytes): encoded json form of the value
+    """
+
+    value = _dump_json(value)
+
+    return value if isinstance(value, bytes) else value.encode("utf-8")
+
+
+def _encode(value):
+    """
+        Purpose:
+            Encode a str value to utf-8 bytes (bytes are returned as is)
+        Args:
+            value (String): value to encode
+        Return
+            value (Bytes): encoded value
+    """
+
+    return value if isinstance(value, bytes) else value.encode("utf-8")
+
+
+def _decode(value):
+    """
+        Purpose:
+            Decode a bytes value from utf-8 (str and None values, e.g. from
+            connections with decode_responses set, are returned as is)
+        Args:
+            value (Bytes): value to decode
+        Return
+            value (String): decoded value
+    """
+
+    return value.decode("utf-8") if isinstance(value, bytes) else value
@@ -5,11 +5,13 @@
 """
 
 # Python Library Imports
+import asyncio
 import fakeredis
 import json
 import os
 import pytest
 import sys
+import threading
 import time
 import timeout_decorator
 from redis.exceptions import ConnectionError, ResponseError
@@ -61,6 +63,23 @@ def reset_fake_redis_con(fake_redis_con):
     fake_redis_con.flushdb()
 
 
+@pytest.fixture(autouse=True)
+def reset_connection_pools():
+    """
+    Purpose:
+        Clear the cached connection pools after each test so that mocked pools from
+        one test are not handed out in another
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    yield
+    redis_connectors._POOLS.clear()
+    redis_connectors._ASYNC_POOLS.clear()
+
+
 #
 # Connecting
 #
@@ -164,6 +183,50 @@ def default_db():
     return 0
 
 
+@pytest.fixture
+def default_pool_options():
+    """
+    Purpose:
+        Set default socket options every redis connection pool is created with
+    Args:
+        N/A
+    Return:
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
+    """
+
+    return {
+        "socket_keepalive": True,
+        "socket_keepalive_options": redis_connectors._SOCKET_KEEPALIVE_OPTIONS,
+        "socket_connect_timeout": 2,
+        "socket_timeout": 5,
+        "health_check_interval": 30,
+    }
+
+
+@pytest.fixture
+def fake_redis_tcp_port():
+    """
+    Purpose:
+        Run a fake redis server on a local TCP port, for tests that need real socket
+        connections (e.g. asyncio connections tied to an event loop)
+    Args:
+        N/A
+    Return:
+        fake_redis_tcp_port (Pytest Fixture (Int)): port of the fake redis server on
+            127.0.0.1
+    """
+
+    server = fakeredis.TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    yield server.server_address[1]
+
+    server.shutdown()
+    server.server_close()
+
+
 ###
 # Mocked Functions
 ###
@@ -209,19 +272,29 @@ def test_get_redis_connection_no_host(mocked_class):
         redis_con = redis_connectors.get_redis_connection()
 
 
+@mock.patch("redis.ConnectionPool")
 @mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
 def test_get_redis_connection_only_host(
-    mocked_class, example_host, default_port, default_password, default_db
+    mocked_class,
+    mocked_pool_class,
+    example_host,
+    default_port,
+    default_password,
+    default_db,
+    default_pool_options,
 ):
     """
     Purpose:
         Tests that redis_connectors.get_redis_connection() requires at least a host
     Args:
         mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
         example_host (Pytest Fixture (String)): example host for redis
         default_port (Pytest Fixture (Int)): default port for redis
         default_password (Pytest Fixture (String)): default password for redis
         default_db (Pytest Fixture (Int)): default db for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
     Return:
         N/A
     """
@@ -230,13 +303,29 @@ def test_get_redis_connection_only_host(
     redis_con = redis_connectors.get_redis_connection(example_host)
 
     # Assertions
-    mocked_class.assert_called_with(host=example_host, port=default_port, db=default_db)
-    mocked_class.assert_called_once()
+    mocked_pool_class.assert_called_with(
+        host=example_host,
+        port=default_port,
+        db=default_db,
+        password=default_password,
+        decode_responses=False,
+        **default_pool_options,
+    )
+    mocked_class.assert_called_once_with(
+        connection_pool=mocked_pool_class.return_value
+    )
 
 
+@mock.patch("redis.ConnectionPool")
 @mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
 def test_get_redis_connection_with_port(
-    mocked_class, example_host, example_port, default_password, default_db
+    mocked_class,
+    mocked_pool_class,
+    example_host,
+    example_port,
+    default_password,
+    default_db,
+    default_pool_options,
 ):
     """
     Purpose:
@@ -244,10 +333,13 @@ def test_get_redis_connection_with_port(
         port if one is provided
     Args:
         mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
         example_host (Pytest Fixture (String)): example host for redis
         example_port (Pytest Fixture (Int)): example port for redis
         default_password (Pytest Fixture (String)): default password for redis
         default_db (Pytest Fixture (Int)): default db for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
     Return:
         N/A
     """
@@ -256,13 +348,29 @@ def test_get_redis_connection_with_port(
     redis_con = redis_connectors.get_redis_connection(example_host, port=example_port)
 
     # Assertions
-    mocked_class.assert_called_with(host=example_host, port=example_port, db=default_db)
-    mocked_class.assert_called_once()
+    mocked_pool_class.assert_called_with(
+        host=example_host,
+        port=example_port,
+        db=default_db,
+        password=default_password,
+        decode_responses=False,
+        **default_pool_options,
+    )
+    mocked_class.assert_called_once_with(
+        connection_pool=mocked_pool_class.return_value
+    )
 
 
+@mock.patch("redis.ConnectionPool")
 @mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
 def test_get_redis_connection_with_db(
-    mocked_class, example_host, default_port, default_password, example_db
+    mocked_class,
+    mocked_pool_class,
+    example_host,
+    default_port,
+    default_password,
+    example_db,
+    default_pool_options,
 ):
     """
     Purpose:
@@ -270,10 +378,13 @@ def test_get_redis_connection_with_db(
         db if one is provided
     Args:
         mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
         example_host (Pytest Fixture (String)): example host for redis
         default_port (Pytest Fixture (Int)): default port for redis
         default_password (Pytest Fixture (String)): default password for redis
         example_db (Pytest Fixture (Int)): example db for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
     Return:
         N/A
     """
@@ -282,13 +393,29 @@ def test_get_redis_connection_with_db(
     redis_con = redis_connectors.get_redis_connection(example_host, db=example_db)
 
     # Assertions
-    mocked_class.assert_called_with(host=example_host, port=default_port, db=example_db)
-    mocked_class.assert_called_once()
+    mocked_pool_class.assert_called_with(
+        host=example_host,
+        port=default_port,
+        db=example_db,
+        password=default_password,
+        decode_responses=False,
+        **default_pool_options,
+    )
+    mocked_class.assert_called_once_with(
+        connection_pool=mocked_pool_class.return_value
+    )
 
 
+@mock.patch("redis.ConnectionPool")
 @mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
 def test_get_redis_connection_with_password(
-    mocked_class, example_host, default_port, example_password, default_db
+    mocked_class,
+    mocked_pool_class,
+    example_host,
+    default_port,
+    example_password,
+    default_db,
+    default_pool_options,
 ):
     """
     Purpose:
@@ -296,10 +423,13 @@ def test_get_redis_connection_with_password(
         password if one is provided
     Args:
         mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
         example_host (Pytest Fixture (String)): example host for redis
         default_port (Pytest Fixture (Int)): default port for redis
         example_password (Pytest Fixture (String)): example password for redis
         default_db (Pytest Fixture (Int)): default db for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
     Return:
         N/A
     """
@@ -310,7 +440,389 @@ def test_get_redis_connection_with_password(
     )
 
     # Assertions
-    mocked_class.assert_called_with(
-        host=example_host, port=default_port, password=example_password, db=default_db
+    mocked_pool_class.assert_called_with(
+        host=example_host,
+        port=default_port,
+        db=default_db,
+        password=example_password,
+        decode_responses=False,
+        **default_pool_options,
+    )
+    mocked_class.assert_called_once_with(
+        connection_pool=mocked_pool_class.return_value
+    )
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connection_reuses_pool(
+    mocked_class, mocked_pool_class, example_host
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connection() only creates one connection
+        pool per server/db and reuses it for later connections
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    redis_connectors.get_redis_connection(example_host)
+    redis_connectors.get_redis_connection(example_host)
+
+    # Assertions
+    mocked_pool_class.assert_called_once()
+    assert mocked_class.call_count == 2
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connection_decode_responses(
+    mocked_class,
+    mocked_pool_class,
+    example_host,
+    default_port,
+    default_db,
+    default_pool_options,
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connection() passes decode_responses to
+        its pool and keeps decoding and non-decoding pools separate
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+        default_port (Pytest Fixture (Int)): default port for redis
+        default_db (Pytest Fixture (Int)): default db for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
+    Return:
+        N/A
+    """
+
+    # Test Call
+    redis_connectors.get_redis_connection(example_host)
+    redis_connectors.get_redis_connection(example_host, decode_responses=True)
+
+    # Assertions
+    assert mocked_pool_class.call_count == 2
+    mocked_pool_class.assert_called_with(
+        host=example_host,
+        port=default_port,
+        db=default_db,
+        password=None,
+        decode_responses=True,
+        **default_pool_options,
+    )
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connection_pool_options(
+    mocked_class,
+    mocked_pool_class,
+    example_host,
+    default_port,
+    default_db,
+    default_pool_options,
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connection() lets callers override the
+        default pool options and keeps pools with different options separate
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+        default_port (Pytest Fixture (Int)): default port for redis
+        default_db (Pytest Fixture (Int)): default db for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
+    Return:
+        N/A
+    """
+
+    # Test Call
+    redis_connectors.get_redis_connection(example_host)
+    redis_connectors.get_redis_connection(example_host, socket_timeout=None)
+    redis_connectors.get_redis_connection(example_host, socket_timeout=None)
+
+    # Assertions
+    assert mocked_pool_class.call_count == 2
+    mocked_pool_class.assert_called_with(
+        host=example_host,
+        port=default_port,
+        db=default_db,
+        password=None,
+        decode_responses=False,
+        **{**default_pool_options, "socket_timeout": None},
+    )
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connection_pool_options_unhashable(
+    mocked_class, mocked_pool_class, example_host
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connection() accepts pool options with
+        unhashable values (lists, sets and nested containers) and reuses their pool
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+    Return:
+        N/A
+    """
+
+    pool_options = {
+        "retry_on_error": [TimeoutError],
+        "example_set": {"value"},
+        "example_nested": [["value"]],
+    }
+
+    # Test Call
+    redis_connectors.get_redis_connection(example_host, **pool_options)
+    redis_connectors.get_redis_connection(example_host, **pool_options)
+
+    # Assertions
+    assert mocked_pool_class.call_count == 1
+    assert mocked_pool_class.call_args.kwargs["retry_on_error"] == [TimeoutError]
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connection_pings(mocked_class, mocked_pool_class, example_host):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connection() checks the connection with
+        PING and never enumerates the keyspace with KEYS
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    redis_con = redis_connectors.get_redis_connection(example_host)
+
+    # Assertions
+    redis_con.ping.assert_called_once_with()
+    redis_con.keys.assert_not_called()
+
+
+###
+# Test Redis Connector Decorator
+###
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connector(
+    mocked_class, mocked_pool_class, example_host, default_port, default_db
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connector() creates the pool when the
+        decorator is created and injects a pooled connection into each call
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+        default_port (Pytest Fixture (Int)): default port for redis
+        default_db (Pytest Fixture (Int)): default db for redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    @redis_connectors.get_redis_connector(example_host, health_check_interval=0)
+    def decorated_function(redis_con, value):
+        return redis_con, value
+
+    mocked_pool_class.assert_called_once()
+    assert mocked_pool_class.call_args.kwargs["health_check_interval"] == 0
+    redis_con, value = decorated_function("value")
+
+    # Assertions
+    assert value == "value"
+    assert redis_con is mocked_class.return_value
+    mocked_class.assert_called_once_with(
+        connection_pool=mocked_pool_class.return_value
+    )
+    redis_con.close.assert_called_once_with()
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connector_closes_on_error(
+    mocked_class, mocked_pool_class, example_host
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connector() releases the connection even
+        when the decorated function raises
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+    Return:
+        N/A
+    """
+
+    @redis_connectors.get_redis_connector(example_host)
+    def decorated_function(redis_con):
+        raise ValueError("Error in decorated function")
+
+    # Test Call
+    with pytest.raises(ValueError):
+        decorated_function()
+
+    # Assertions
+    mocked_class.return_value.close.assert_called_once_with()
+
+
+@mock.patch("redis.ConnectionPool")
+@mock.patch("redis.StrictRedis", autospec=fakeredis.FakeStrictRedis)
+def test_get_redis_connector_wraps(mocked_class, mocked_pool_class, example_host):
+    """
+    Purpose:
+        Tests that redis_connectors.get_redis_connector() keeps the name and docstring
+        of the decorated function
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.StrictRedis
+        mocked_pool_class (Mocked Class): Mocked version of redis.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    @redis_connectors.get_redis_connector(example_host)
+    def decorated_function(redis_con):
+        """Decorated Function Docstring"""
+
+    # Assertions
+    assert decorated_function.__name__ == "decorated_function"
+    assert decorated_function.__doc__ == "Decorated Function Docstring"
+
+
+###
+# Test Async Redis Connector Decorator
+###
+
+
+@mock.patch("redis.asyncio.ConnectionPool")
+@mock.patch("redis.asyncio.Redis")
+def test_get_async_redis_connector(
+    mocked_class, mocked_pool_class, example_host, default_pool_options
+):
+    """
+    Purpose:
+        Tests that redis_connectors.get_async_redis_connector() creates an asyncio pool
+        for the running event loop when the decorated coroutine is called, injects a
+        pooled connection into each call and closes it afterwards
+    Args:
+        mocked_class (Mocked Class): Mocked version of redis.asyncio.Redis
+        mocked_pool_class (Mocked Class): Mocked version of redis.asyncio.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+        default_pool_options (Pytest Fixture (Dict)): default socket options for
+            redis connection pools
+    Return:
+        N/A
+    """
+
+    mocked_class.return_value.aclose = mock.AsyncMock()
+
+    # Test Call
+    @redis_connectors.get_async_redis_connector(example_host)
+    async def decorated_function(redis_con, value):
+        return redis_con, value
+
+    redis_con, value = asyncio.run(decorated_function("value"))
+
+    # Assertions
+    assert value == "value"
+    assert redis_con is mocked_class.return_value
+    mocked_pool_class.assert_called_once_with(
+        host=example_host,
+        port=6379,
+        db=0,
+        password=None,
+        decode_responses=False,
+        **default_pool_options,
+    )
+    mocked_class.assert_called_once_with(
+        connection_pool=mocked_pool_class.return_value
     )
-    mocked_class.assert_called_once()
+    redis_con.aclose.assert_awaited_once_with()
+    assert redis_connectors._POOLS == {}
+
+
+def test_get_async_redis_connector_multiple_event_loops(fake_redis_tcp_port):
+    """
+    Purpose:
+        Tests that a redis_connectors.get_async_redis_connector() decorated coroutine
+        can be run in several event loops one after another (asyncio connections are
+        tied to the loop that opened them, so pools must not be shared across loops)
+    Args:
+        fake_redis_tcp_port (Pytest Fixture (Int)): port of the fake redis server on
+            127.0.0.1
+    Return:
+        N/A
+    """
+
+    @redis_connectors.get_async_redis_connector("127.0.0.1", port=fake_redis_tcp_port)
+    async def decorated_function(redis_con, value):
+        await redis_con.set("key", value)
+        return await redis_con.get("key")
+
+    async def run_in_loop(value):
+        try:
+            return await decorated_function(value)
+        finally:
+            await redis_connectors.close_async_redis_connection_pools()
+
+    # Test Call
+    values = [asyncio.run(run_in_loop(f"value_{index}")) for index in range(3)]
+
+    # Assertions
+    assert values == [b"value_0", b"value_1", b"value_2"]
+    assert len(redis_connectors._ASYNC_POOLS) == 0
+
+
+@mock.patch("redis.asyncio.ConnectionPool")
+def test_close_async_redis_connection_pools(mocked_pool_class, example_host):
+    """
+    Purpose:
+        Tests that redis_connectors.close_async_redis_connection_pools() disconnects
+        and forgets the pools of the running event loop, so a later call creates a new
+        pool
+    Args:
+        mocked_pool_class (Mocked Class): Mocked version of redis.asyncio.ConnectionPool
+        example_host (Pytest Fixture (String)): example host for redis
+    Return:
+        N/A
+    """
+
+    mocked_pool_class.return_value.disconnect = mock.AsyncMock()
+
+    async def get_and_close_pool():
+        redis_connectors.get_async_redis_connection_pool(example_host)
+        await redis_connectors.close_async_redis_connection_pools()
+        redis_connectors.get_async_redis_connection_pool(example_host)
+
+    # Test Call
+    asyncio.run(get_and_close_pool())
+
+    # Assertions
+    mocked_pool_class.return_value.disconnect.assert_awaited_once_with()
+    assert mocked_pool_class.call_count == 2
@@ -5,9 +5,11 @@
 """
 
 # Python Library Imports
+import asyncio
 import os
 import sys
 import fakeredis
+import math
 import pytest
 import redis
 from unittest import mock
@@ -21,7 +23,55 @@ from redis_helpers import redis_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.fixture
+def fake_redis_con():
+    """
+    Purpose:
+        Create Fake Redis Connection To Test With
+    Args:
+        N/A
+    Return:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    """
+
+    return fakeredis.FakeStrictRedis()
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_redis_con(fake_redis_con):
+    """
+    Purpose:
+        Flush the fake_redis_con keys after each test so that one test to another does
+        not affect each other.
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.flushdb()
+
+
+@pytest.fixture
+def example_keys(fake_redis_con):
+    """
+    Purpose:
+        Load example keys into the fake redis connection
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    """
+
+    example_keys = [f"user:{index}".encode("utf-8") for index in range(25)]
+    for key in example_keys:
+        fake_redis_con.set(key, b"value")
+    fake_redis_con.set(b"other:key", b"value")
+
+    return example_keys
 
 
 ###
@@ -29,12 +79,851 @@ from redis_helpers import redis_helpers
 ###
 
 
-# None at the Moment (Empty Test Suite)
+# Utilizing FakeRedis for Mocking
+
+
+###
+# Test Managing Keys
+###
+
+
+def test_get_keys_matching_pattern(fake_redis_con, example_keys):
+    """
+    Purpose:
+        Tests that redis_helpers.get_keys_matching_pattern() lazily yields every key
+        matching the pattern
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    keys = redis_helpers.get_keys_matching_pattern(fake_redis_con, "user:*", count=10)
+
+    # Assertions
+    assert not isinstance(keys, list)
+    assert sorted(keys) == sorted(example_keys)
+
+
+def test_get_all_keys_matching_pattern(fake_redis_con, example_keys):
+    """
+    Purpose:
+        Tests that redis_helpers.get_all_keys_matching_pattern() returns a list of
+        every key matching the pattern
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    keys = redis_helpers.get_all_keys_matching_pattern(fake_redis_con)
+
+    # Assertions
+    assert isinstance(keys, list)
+    assert sorted(keys) == sorted(example_keys + [b"other:key"])
+
+
+def test_delete_keys_matching_pattern(fake_redis_con, example_keys):
+    """
+    Purpose:
+        Tests that redis_helpers.delete_keys_matching_pattern() deletes only the keys
+        matching the pattern
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    was_successful = redis_helpers.delete_keys_matching_pattern(
+        fake_redis_con, "user:*"
+    )
+
+    # Assertions
+    assert was_successful
+    assert fake_redis_con.keys() == [b"other:key"]
+
+
+def test_delete_keys_matching_pattern_batches(fake_redis_con, example_keys):
+    """
+    Purpose:
+        Tests that redis_helpers.delete_keys_matching_pattern() deletes every matching
+        key when the keys span multiple batches
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    was_successful = redis_helpers.delete_keys_matching_pattern(
+        fake_redis_con, "user:*", batch_size=7
+    )
+
+    # Assertions
+    assert was_successful
+    assert fake_redis_con.keys() == [b"other:key"]
+
+
+def test_delete_keys_matching_pattern_no_transaction(fake_redis_con, example_keys):
+    """
+    Purpose:
+        Tests that redis_helpers.delete_keys_matching_pattern() pipelines the deletes
+        without wrapping them in a MULTI/EXEC transaction
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    with mock.patch.object(
+        fake_redis_con, "pipeline", wraps=fake_redis_con.pipeline
+    ) as mocked_pipeline:
+        redis_helpers.delete_keys_matching_pattern(fake_redis_con, "user:*")
+
+    # Assertions
+    mocked_pipeline.assert_called_once_with(transaction=False)
+
+
+def test_delete_keys_matching_pattern_error(fake_redis_con, example_keys):
+    """
+    Purpose:
+        Tests that redis_helpers.delete_keys_matching_pattern() returns False when
+        Redis raises an error while deleting
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        example_keys (Pytest Fixture (List of Bytes)): keys loaded into redis
+    Return:
+        N/A
+    """
+
+    with mock.patch.object(
+        fake_redis_con, "scan_iter", side_effect=redis.exceptions.ConnectionError
+    ):
+        # Test Call
+        was_successful = redis_helpers.delete_keys_matching_pattern(
+            fake_redis_con, "user:*"
+        )
+
+    # Assertions
+    assert not was_successful
+
+
+###
+# Test Single Value Key Functions
+###
+
+
+def test_set_value_of_single_value_key(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.set_value_of_single_value_key() sets a key that does
+        not exist yet
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    # Test Call
+    was_successful = redis_helpers.set_value_of_single_value_key(
+        fake_redis_con, "key", "value"
+    )
+
+    # Assertions
+    assert was_successful
+    assert fake_redis_con.get("key") == b"value"
+
+
+def test_set_value_of_single_value_key_no_overwrite(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.set_value_of_single_value_key() does not overwrite an
+        existing key when overwrite is False, and never issues a GET
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.set("key", "existing")
+
+    # Test Call
+    with mock.patch.object(fake_redis_con, "get") as mocked_get:
+        was_successful = redis_helpers.set_value_of_single_value_key(
+            fake_redis_con, "key", "value"
+        )
+
+    # Assertions
+    assert not was_successful
+    mocked_get.assert_not_called()
+    assert fake_redis_con.get("key") == b"existing"
+
+
+def test_set_value_of_single_value_key_overwrite(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.set_value_of_single_value_key() overwrites an
+        existing key when overwrite is True
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.set("key", "existing")
+
+    # Test Call
+    was_successful = redis_helpers.set_value_of_single_value_key(
+        fake_redis_con, "key", {"field": "value"}, overwrite=True, value_format="json"
+    )
+
+    # Assertions
+    assert was_successful
+    assert fake_redis_con.get("key") == b'{"field":"value"}'
+
+
+def test_get_value_of_single_value_key_decode(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.get_value_of_single_value_key() decodes bytes values
+        when value_decode is set
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.set("key", "value")
+
+    # Test Call
+    value = redis_helpers.get_value_of_single_value_key(
+        fake_redis_con, "key", value_decode="utf-8"
+    )
+
+    # Assertions
+    assert value == "value"
+
+
+def test_get_value_of_single_value_key_decode_responses():
+    """
+    Purpose:
+        Tests that redis_helpers.get_value_of_single_value_key() skips decoding when
+        the connection already decodes responses
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    decoding_redis_con = fakeredis.FakeStrictRedis(decode_responses=True)
+    decoding_redis_con.set("key", '{"field": "value"}')
+
+    # Test Call
+    value = redis_helpers.get_value_of_single_value_key(
+        decoding_redis_con, "key", value_format="json", value_decode="utf-8"
+    )
+
+    # Assertions
+    assert value == {"field": "value"}
+
+
+def test_get_or_set_value_of_single_value_key(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.get_or_set_value_of_single_value_key() sets a missing
+        key and returns the prior value without overwriting an existing key
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    # Test Call
+    first_prior_value = redis_helpers.get_or_set_value_of_single_value_key(
+        fake_redis_con, "key", {"field": 1}, value_format="json"
+    )
+    second_prior_value = redis_helpers.get_or_set_value_of_single_value_key(
+        fake_redis_con, "key", {"field": 2}, value_format="json"
+    )
+
+    # Assertions
+    assert first_prior_value is None
+    assert second_prior_value == {"field": 1}
+    assert fake_redis_con.get("key") == b'{"field":1}'
+
+
+def test_get_or_set_value_of_single_value_key_registers_on_caller(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.get_or_set_value_of_single_value_key() registers its
+        Lua script against the caller's connection instead of a module-level client
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    # Test Call
+    with mock.patch.object(
+        fake_redis_con, "register_script", wraps=fake_redis_con.register_script
+    ) as mocked_register_script:
+        redis_helpers.get_or_set_value_of_single_value_key(fake_redis_con, "key", "a")
+
+    # Assertions
+    mocked_register_script.assert_called_once_with(redis_helpers._SET_IF_ABSENT_LUA)
+    assert fake_redis_con.get("key") == b"a"
+
+
+def test_mset_values_and_mget_values_json(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.mset_values() and redis_helpers.mget_values() round
+        trip json values for many keys, returning None for missing keys
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    mapping = {"key_1": {"field": 1}, "key_2": [1, 2, 3]}
+
+    # Test Call
+    was_successful = redis_helpers.mset_values(
+        fake_redis_con, mapping, value_format="json", value_encode="utf-8"
+    )
+    values = redis_helpers.mget_values(
+        fake_redis_con,
+        ["key_1", "missing", "key_2"],
+        value_format="json",
+        value_decode="utf-8",
+    )
+
+    # Assertions
+    assert was_successful
+    assert values == [{"field": 1}, None, [1, 2, 3]]
+
+
+def test_mget_values_raw(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.mget_values() returns the raw values when no format
+        or decoding is requested
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.mset({"key_1": "value_1", "key_2": "value_2"})
+
+    # Test Call
+    values = redis_helpers.mget_values(fake_redis_con, ["key_1", "key_2"])
+
+    # Assertions
+    assert values == [b"value_1", b"value_2"]
+
+
+@mock.patch.object(redis_helpers, "orjson", None)
+def test_mget_values_json_without_orjson(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.mget_values() loads json with the standard library
+        when orjson is not installed
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.set("key_1", '{"field":1}')
+
+    # Test Call
+    values = redis_helpers.mget_values(
+        fake_redis_con, ["key_1", "missing"], value_format="json"
+    )
+
+    # Assertions
+    assert values == [{"field": 1}, None]
+
+
+###
+# Test List Key Functions
+###
+
+
+def test_lpush_many(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.lpush_many() pushes every value onto the list
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    # Test Call
+    was_successful = redis_helpers.lpush_many(fake_redis_con, "list", ["a", "b", "c"])
+
+    # Assertions
+    assert was_successful
+    assert fake_redis_con.lrange("list", 0, -1) == [b"c", b"b", b"a"]
+
+
+def test_lpush_values_and_iter_list_values_json(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.lpush_values() and redis_helpers.iter_list_values()
+        round trip json values across several LRANGE chunks
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    values = [{"index": index} for index in range(10)]
+
+    # Test Call
+    was_successful = redis_helpers.lpush_values(
+        fake_redis_con, "list", values, value_format="json"
+    )
+    list_values = redis_helpers.iter_list_values(
+        fake_redis_con, "list", chunk=3, value_format="json"
+    )
+
+    # Assertions
+    assert was_successful
+    assert not isinstance(list_values, list)
+    assert list(list_values) == list(reversed(values))
+
+
+def test_iter_list_values_decode(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.iter_list_values() decodes values and stops when the
+        list length is an exact multiple of the chunk size
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    fake_redis_con.rpush("list", "a", "b", "c", "d")
+
+    # Test Call
+    list_values = redis_helpers.iter_list_values(
+        fake_redis_con, "list", chunk=2, value_decode="utf-8"
+    )
+
+    # Assertions
+    assert list(list_values) == ["a", "b", "c", "d"]
+
+
+@pytest.mark.parametrize("chunk", [0, -1])
+def test_iter_list_values_invalid_chunk(fake_redis_con, chunk):
+    """
+    Purpose:
+        Tests that redis_helpers.iter_list_values() raises a ValueError as soon as it
+        is called with a chunk size below 1 (which would otherwise loop forever)
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        chunk (Int): invalid chunk size
+    Return:
+        N/A
+    """
+
+    fake_redis_con.rpush("list", "a")
+
+    # Test Call / Assertions
+    with pytest.raises(ValueError):
+        redis_helpers.iter_list_values(fake_redis_con, "list", chunk=chunk)
+
+
+###
+# Test Async Single Value Key Functions
+###
+
+
+def test_aset_and_aget_value_of_single_value_key():
+    """
+    Purpose:
+        Tests that redis_helpers.aset_value_of_single_value_key() and
+        redis_helpers.aget_value_of_single_value_key() round trip json values when
+        run concurrently
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    async def run_test():
+        async_redis_con = fakeredis.FakeAsyncRedis()
+        was_successful = await asyncio.gather(
+            *[
+                redis_helpers.aset_value_of_single_value_key(
+                    async_redis_con,
+                    f"key_{index}",
+                    {"index": index},
+                    value_format="json",
+                )
+                for index in range(3)
+            ]
+        )
+        not_overwritten = await redis_helpers.aset_value_of_single_value_key(
+            async_redis_con, "key_0", "value"
+        )
+        values = await asyncio.gather(
+            *[
+                redis_helpers.aget_value_of_single_value_key(
+                    async_redis_con, f"key_{index}", value_format="json"
+                )
+                for index in range(3)
+            ]
+        )
+        return was_successful, not_overwritten, values
+
+    # Test Call
+    was_successful, not_overwritten, values = asyncio.run(run_test())
+
+    # Assertions
+    assert was_successful == [True, True, True]
+    assert not not_overwritten
+    assert values == [{"index": 0}, {"index": 1}, {"index": 2}]
+
+
+def test_aset_value_of_single_value_key_error(caplog):
+    """
+    Purpose:
+        Tests that redis_helpers.aset_value_of_single_value_key() returns False and
+        logs the exception when Redis raises an error while setting
+    Args:
+        caplog (Pytest Fixture (LogCaptureFixture)): captured log records
+    Return:
+        N/A
+    """
+
+    async_redis_con = fakeredis.FakeAsyncRedis()
+
+    # Test Call
+    with mock.patch.object(
+        async_redis_con,
+        "set",
+        side_effect=redis.exceptions.ConnectionError("Connection Lost"),
+    ):
+        was_successful = asyncio.run(
+            redis_helpers.aset_value_of_single_value_key(
+                async_redis_con, "key", "value"
+            )
+        )
+
+    # Assertions
+    assert not was_successful
+    assert "Connection Lost" in caplog.text
 
 
 ###
-# Test Payload
+# Test Specialized Value Functions
 ###
 
 
-# None at the Moment (Empty Test Suite)
+@pytest.mark.parametrize(
+    "value_format,value_encode,value,expected_stored_value",
+    [
+        (None, None, "value", b"value"),
+        ("json", None, {"field": 1}, b'{"field":1}'),
+        (None, "utf-8", "value", b"value"),
+        ("json", "utf-8", {"field": 1}, b'{"field":1}'),
+        ("json", None, b'{"field":1}', b'{"field":1}'),
+        ("json", "utf-8", b'{"field":1}', b'{"field":1}'),
+        (None, "utf-8", b"value", b"value"),
+    ],
+)
+def test_make_value_setter(
+    fake_redis_con, value_format, value_encode, value, expected_stored_value
+):
+    """
+    Purpose:
+        Tests that redis_helpers.make_value_setter() builds a setter storing values
+        in the same form as redis_helpers.set_value_of_single_value_key()
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        value_format (String): form of value to convert to string
+        value_encode (String): encoding type for the value
+        value (Object): value to set
+        expected_stored_value (Bytes): value expected in redis
+    Return:
+        N/A
+    """
+
+    # Test Call
+    setter = redis_helpers.make_value_setter(
+        value_format=value_format, value_encode=value_encode
+    )
+    setter(fake_redis_con, "specialized_key", value)
+    redis_helpers.set_value_of_single_value_key(
+        fake_redis_con,
+        "key",
+        value,
+        value_format=value_format,
+        value_encode=value_encode,
+    )
+
+    # Assertions
+    assert fake_redis_con.get("specialized_key") == expected_stored_value
+    assert fake_redis_con.get("key") == expected_stored_value
+
+
+@pytest.mark.parametrize(
+    "value_format,value_decode,stored_value,expected_value",
+    [
+        (None, None, b"value", b"value"),
+        ("json", None, b'{"field":1}', {"field": 1}),
+        (None, "utf-8", b"value", "value"),
+        ("json", "utf-8", b'{"field":1}', {"field": 1}),
+    ],
+)
+def test_make_value_getter(
+    fake_redis_con, value_format, value_decode, stored_value, expected_value
+):
+    """
+    Purpose:
+        Tests that redis_helpers.make_value_getter() builds a getter converting values
+        in the same way as redis_helpers.get_value_of_single_value_key()
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+        value_format (String): form to return value
+        value_decode (String): encoding type for the value
+        stored_value (Bytes): value stored in redis
+        expected_value (Object): value expected from the getter
+    Return:
+        N/A
+    """
+
+    fake_redis_con.set("key", stored_value)
+
+    # Test Call
+    getter = redis_helpers.make_value_getter(
+        value_format=value_format, value_decode=value_decode
+    )
+
+    # Assertions
+    assert getter(fake_redis_con, "key") == expected_value
+
+
+def test_make_list_value_adder(fake_redis_con):
+    """
+    Purpose:
+        Tests that redis_helpers.make_list_value_adder() builds a function pushing
+        serialized values onto a list
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    # Test Call
+    adder = redis_helpers.make_list_value_adder(value_format="json")
+    adder(fake_redis_con, "list", {"index": 0})
+    adder(fake_redis_con, "list", {"index": 1})
+
+    # Assertions
+    assert fake_redis_con.lrange("list", 0, -1) == [b'{"index":1}', b'{"index":0}']
+
+
+###
+# Test Serialization Functions
+###
+
+
+def test_serialize():
+    """
+    Purpose:
+        Tests that redis_helpers._serialize() dumps compact json, encodes values,
+        passes bytes through and keeps equal values of different types apart
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    def serialize(*args):
+        value = redis_helpers._serialize(*args)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    # Assertions
+    assert serialize({"a": 1, "b": [1, 2]}, "json") == '{"a":1,"b":[1,2]}'
+    assert serialize({1: "a"}, "json") == '{"1":"a"}'
+    assert serialize(2 ** 70, "json") == str(2 ** 70)
+    assert serialize(1, "json") == "1"
+    assert serialize(True, "json") == "true"
+    assert serialize(1.0, "json") == "1.0"
+    assert redis_helpers._serialize("value", value_encode="utf-8") == b"value"
+    assert redis_helpers._serialize(b"value", "json", "utf-8") == b"value"
+    assert redis_helpers._serialize({"a": 1}, "json", "utf-8") == b'{"a":1}'
+
+
+def test_serialize_cache():
+    """
+    Purpose:
+        Tests that redis_helpers._serialize() only memoizes short values that need
+        transforming, so untransformed and large values are never pinned in the cache
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    redis_helpers._serialize_cached.cache_clear()
+    large_value = "x" * (redis_helpers._SERIALIZE_CACHE_MAX_LENGTH + 1)
+
+    # Test Call
+    untransformed_value = redis_helpers._serialize("value")
+    redis_helpers._serialize(large_value, "json")
+    redis_helpers._serialize("value", "json")
+
+    # Assertions
+    assert untransformed_value == "value"
+    assert redis_helpers._serialize_cached.cache_info().currsize == 1
+
+
+def test_serialize_signed_zero():
+    """
+    Purpose:
+        Tests that redis_helpers._serialize() keeps the sign of a float zero, which a
+        cache keyed on equal values would lose (0.0 == -0.0)
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    # Test Call
+    positive_zero = redis_helpers._serialize(0.0, "json")
+    negative_zero = redis_helpers._serialize(-0.0, "json")
+
+    # Assertions
+    assert math.copysign(1, redis_helpers._json_loads(positive_zero)) == 1
+    assert math.copysign(1, redis_helpers._json_loads(negative_zero)) == -1
+
+
+@mock.patch.object(redis_helpers, "orjson", None)
+def test_serialize_without_orjson():
+    """
+    Purpose:
+        Tests that redis_helpers._serialize() and redis_helpers._json_loads() fall
+        back to the standard library when orjson is not installed
+    Args:
+        N/A
+    Return:
+        N/A
+    """
+
+    # Test Call
+    value = redis_helpers._serialize({"a": [1, 2]}, "json", "utf-8")
+
+    # Assertions
+    assert value == b'{"a":[1,2]}'
+    assert redis_helpers._json_loads(value) == {"a": [1, 2]}
+
+
+@mock.patch.object(redis_helpers, "orjson", None)
+def test_json_round_trip_exact_without_orjson(fake_redis_con):
+    """
+    Purpose:
+        Tests that without orjson, json values the standard library supports exactly
+        (integers over 64 bits, NaN and Infinity) round trip through redis unchanged
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    value = {"big": 2 ** 70, "nested": [-(2 ** 64), 1.5], "nan": float("nan")}
+
+    # Test Call
+    redis_helpers.set_value_of_single_value_key(
+        fake_redis_con, "key", value, value_format="json"
+    )
+    redis_helpers.lpush_values(
+        fake_redis_con, "list", [2 ** 70, float("inf")], value_format="json"
+    )
+    single_value = redis_helpers.get_value_of_single_value_key(
+        fake_redis_con, "key", value_format="json"
+    )
+    mget_value = redis_helpers.mget_values(
+        fake_redis_con, ["key"], value_format="json"
+    )[0]
+    list_values = list(
+        redis_helpers.iter_list_values(fake_redis_con, "list", value_format="json")
+    )
+
+    # Assertions
+    for loaded_value in [single_value, mget_value]:
+        assert loaded_value["big"] == 2 ** 70
+        assert isinstance(loaded_value["big"], int)
+        assert loaded_value["nested"] == [-(2 ** 64), 1.5]
+        assert math.isnan(loaded_value["nan"])
+    assert list_values == [float("inf"), 2 ** 70]
+
+
+@pytest.mark.skipif(redis_helpers.orjson is None, reason="orjson is not installed")
+def test_json_orjson_unsupported_values(fake_redis_con):
+    """
+    Purpose:
+        Tests the documented orjson behaviour for values it can not represent:
+        integers over 64 bits are still written (via the standard library) and NaN is
+        written as null, and json written without orjson (NaN) can still be loaded
+    Args:
+        fake_redis_con (Pytest Fixture (FakeRedis Connection Obj)): Fake redis connection
+            that simulates redis functionality for testing
+    Return:
+        N/A
+    """
+
+    # Test Call
+    redis_helpers.set_value_of_single_value_key(
+        fake_redis_con, "big", 2 ** 70, value_format="json"
+    )
+    redis_helpers.set_value_of_single_value_key(
+        fake_redis_con, "nan", [float("nan")], value_format="json"
+    )
+    fake_redis_con.set("stdlib_nan", "[NaN]")
+    stdlib_nan_value = redis_helpers.get_value_of_single_value_key(
+        fake_redis_con, "stdlib_nan", value_format="json"
+    )
+
+    # Assertions
+    assert fake_redis_con.get("big") == str(2 ** 70).encode("utf-8")
+    assert fake_redis_con.get("nan") == b"[null]"
+    assert math.isnan(stdlib_nan_value[0])
@@ -140,7 +140,7 @@ def main():
     setup(
         name="ctodd-python-lib-redis",
         version=version,
-        python_requires=">3.0,<3.7",
+        python_requires=">=3.8",
         description=("Python utilities used for interacting with Redis"),
         url="https://github.com/ChristopherHaydenTodd/ctodd-python-lib-redis",
         author="Christopher H. Todd",